@@ -0,0 +1,27 @@
+"""composite descending index for the posts feed
+
+Revision ID: 0002_posts_feed_index
+Revises: 0001_init
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0002_posts_feed_index"
+down_revision = "0001_init"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_posts_created_at", table_name="posts")
+    op.create_index("ix_posts_created_at_id_desc", "posts", [sa.text("created_at DESC"), sa.text("id DESC")], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_created_at_id_desc", table_name="posts")
+    op.create_index("ix_posts_created_at", "posts", ["created_at"], unique=False)
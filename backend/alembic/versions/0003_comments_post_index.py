@@ -0,0 +1,26 @@
+"""composite index for per-post comment lists and counts
+
+Revision ID: 0003_comments_post_index
+Revises: 0002_posts_feed_index
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0003_comments_post_index"
+down_revision = "0002_posts_feed_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_comments_post_id", table_name="comments")
+    op.create_index("ix_comments_post_id_created", "comments", ["post_id", "created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comments_post_id_created", table_name="comments")
+    op.create_index("ix_comments_post_id", "comments", ["post_id"], unique=False)
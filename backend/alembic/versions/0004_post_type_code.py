@@ -0,0 +1,34 @@
+"""store post type as a one-letter code
+
+Revision ID: 0004_post_type_code
+Revises: 0003_comments_post_index
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004_post_type_code"
+down_revision = "0003_comments_post_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE posts ALTER COLUMN type TYPE CHAR(1) "
+        "USING CASE type::text WHEN 'text' THEN 't' WHEN 'link' THEN 'l' WHEN 'photo' THEN 'p' END"
+    )
+    op.create_check_constraint("ck_posts_type", "posts", "type IN ('t', 'l', 'p')")
+    op.execute("DROP TYPE post_type")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_posts_type", "posts", type_="check")
+    op.execute("CREATE TYPE post_type AS ENUM ('text', 'link', 'photo')")
+    op.execute(
+        "ALTER TABLE posts ALTER COLUMN type TYPE post_type "
+        "USING (CASE type WHEN 't' THEN 'text' WHEN 'l' THEN 'link' WHEN 'p' THEN 'photo' END)::post_type"
+    )
@@ -0,0 +1,34 @@
+"""text columns for urls and password hashes
+
+Revision ID: 0005_text_url_columns
+Revises: 0004_post_type_code
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0005_text_url_columns"
+down_revision = "0004_post_type_code"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # varchar -> text is binary-coercible, so these don't rewrite the tables.
+    op.alter_column("posts", "link_url", type_=sa.Text(), existing_type=sa.String(length=2048), existing_nullable=True)
+    op.alter_column("posts", "image_url", type_=sa.Text(), existing_type=sa.String(length=2048), existing_nullable=True)
+    op.alter_column("users", "password_hash", type_=sa.Text(), existing_type=sa.String(length=255), existing_nullable=False)
+    op.create_check_constraint("ck_posts_link_url_len", "posts", "char_length(link_url) <= 2048")
+    op.create_check_constraint("ck_posts_image_url_len", "posts", "char_length(image_url) <= 2048")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_posts_image_url_len", "posts", type_="check")
+    op.drop_constraint("ck_posts_link_url_len", "posts", type_="check")
+    op.alter_column("users", "password_hash", type_=sa.String(length=255), existing_type=sa.Text(), existing_nullable=False)
+    op.alter_column("posts", "image_url", type_=sa.String(length=2048), existing_type=sa.Text(), existing_nullable=True)
+    op.alter_column("posts", "link_url", type_=sa.String(length=2048), existing_type=sa.Text(), existing_nullable=True)
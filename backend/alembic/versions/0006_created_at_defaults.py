@@ -0,0 +1,29 @@
+"""per-row created_at defaults
+
+Revision ID: 0006_created_at_defaults
+Revises: 0005_text_url_columns
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006_created_at_defaults"
+down_revision = "0005_text_url_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column("users", "created_at", server_default=sa.text("statement_timestamp()"), existing_type=sa.DateTime(timezone=True), existing_nullable=False)
+    op.alter_column("posts", "created_at", server_default=sa.text("clock_timestamp()"), existing_type=sa.DateTime(timezone=True), existing_nullable=False)
+    op.alter_column("comments", "created_at", server_default=sa.text("clock_timestamp()"), existing_type=sa.DateTime(timezone=True), existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column("comments", "created_at", server_default=sa.text("now()"), existing_type=sa.DateTime(timezone=True), existing_nullable=False)
+    op.alter_column("posts", "created_at", server_default=sa.text("now()"), existing_type=sa.DateTime(timezone=True), existing_nullable=False)
+    op.alter_column("users", "created_at", server_default=sa.text("now()"), existing_type=sa.DateTime(timezone=True), existing_nullable=False)
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from sqladmin import Admin, ModelView
+from wtforms import SelectField
 
 from app.db import engine
-from app.models import Comment, Post, User
+from app.models import Comment, Post, PostType, User
 
 
 class UserAdmin(ModelView, model=User):
@@ -18,6 +19,9 @@ class PostAdmin(ModelView, model=Post):
     column_list = [Post.id, Post.created_at, Post.type, Post.title, Post.author_id]
     column_searchable_list = [Post.title, Post.body]
     column_sortable_list = [Post.created_at]
+    # The column stores a one-letter code; edit it as a PostType choice instead.
+    form_overrides = {"type": SelectField}
+    form_args = {"type": {"choices": [(t.value, t.value) for t in PostType]}}
 
 
 class CommentAdmin(ModelView, model=Comment):
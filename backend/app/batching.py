@@ -0,0 +1,111 @@
+"""Asynchronous batching of single-row INSERTs for bursty write endpoints."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from typing import Any
+
+from sqlalchemy import Row, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.constants import INSERT_BATCH_MAX_SIZE, INSERT_BATCH_MAX_WAIT_SECONDS
+from app.db import SessionLocal
+from app.models import Base, Comment, Post
+
+_Pending = tuple[dict[str, Any], "asyncio.Future[Row[Any]]"]
+
+
+class InsertBatcher:
+    """Coalesce concurrent single-row INSERTs into one multi-row INSERT ... RETURNING.
+
+    Callers await ``submit(values)`` and get back the RETURNING row for their own
+    values. One background task collects rows for up to ``max_wait`` seconds (or
+    until ``max_size`` are queued) and writes them with a single statement and a
+    single commit, so a write burst shares one round trip and one fsync.
+    """
+
+    def __init__(
+        self,
+        model: type[Base],
+        returning: tuple[InstrumentedAttribute[Any], ...],
+        *,
+        max_size: int = INSERT_BATCH_MAX_SIZE,
+        max_wait: float = INSERT_BATCH_MAX_WAIT_SECONDS,
+    ) -> None:
+        # sort_by_parameter_order maps RETURNING rows back to the submitted values;
+        # render_nulls keeps rows with different None columns in the same statement.
+        self._stmt = (
+            insert(model)
+            .returning(*returning, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True)
+        )
+        self._max_size = max_size
+        self._max_wait = max_wait
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def submit(self, values: dict[str, Any]) -> Row[Any]:
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        fut: asyncio.Future[Row[Any]] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((values, fut))
+        return await fut
+
+    async def aclose(self) -> None:
+        """Stop the background task and flush whatever is still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending:
+            await self._flush(pending)
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() < self._max_size - 1:
+                await asyncio.sleep(self._max_wait)
+            while len(batch) < self._max_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[_Pending]) -> None:
+        try:
+            async with SessionLocal() as session:
+                result = await session.execute(self._stmt, [values for values, _ in batch])
+                rows = result.all()
+                await session.commit()
+        except IntegrityError as e:
+            if len(batch) > 1:
+                # One bad row (e.g. a dangling foreign key) must not fail its neighbours:
+                # retry one by one so only the offending caller sees the error.
+                for item in batch:
+                    await self._flush([item])
+                return
+            _, fut = batch[0]
+            if not fut.done():
+                fut.set_exception(e)
+            return
+        except BaseException as e:
+            # Every caller in the batch sees the failure; cancellation still propagates.
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e if isinstance(e, Exception) else RuntimeError("Insert batch cancelled"))
+            if not isinstance(e, Exception):
+                raise
+            return
+        for (_, fut), row in zip(batch, rows):
+            if not fut.done():
+                fut.set_result(row)
+
+
+post_batcher = InsertBatcher(Post, (Post.id, Post.created_at))
+comment_batcher = InsertBatcher(Comment, (Comment.id, Comment.created_at))
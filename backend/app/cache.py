@@ -1,55 +1,87 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+import uuid
+from collections.abc import Iterable
 
+from cachetools import TTLCache
 from redis import asyncio as redis_async
 from redis.exceptions import RedisError
 
+from app.constants import (
+    KNOWN_POSTS_MAXSIZE,
+    KNOWN_POSTS_TTL_SECONDS,
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT_SECONDS,
+)
 from app.settings import settings
 
 _redis: redis_async.Redis | None = None
 
+# Post ids recently seen in the database, so comment writes can skip the existence check.
+_known_posts: TTLCache[uuid.UUID, bool] = TTLCache(maxsize=KNOWN_POSTS_MAXSIZE, ttl=KNOWN_POSTS_TTL_SECONDS)
+
+
+def init_redis() -> redis_async.Redis | None:
+    """Create the global Redis client on a bounded connection pool (called once at startup)."""
+    global _redis
+    if _redis is not None or not settings.redis_url:
+        return _redis
+    # Raw bytes in and out: payloads are stored pre-serialized and served as-is.
+    pool = redis_async.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT_SECONDS,
+        socket_keepalive=True,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        decode_responses=False,
+    )
+    _redis = redis_async.Redis(connection_pool=pool)
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is None:
+        return
+    await _redis.aclose(close_connection_pool=True)
+    _redis = None
+
 
 def get_redis() -> redis_async.Redis | None:
-  """Return a global Redis client or None if disabled."""
-  global _redis
-  if _redis is not None:
-      return _redis
-  if not settings.redis_url:
-      return None
-  _redis = redis_async.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
-  return _redis
+    """Return the global Redis client, or None if disabled or not yet initialized."""
+    return _redis
 
 
-async def cache_get_json(key: str) -> Any | None:
+async def cache_get_bytes(key: str) -> bytes | None:
+    """Return a pre-serialized payload as stored, without decoding it."""
     client = get_redis()
     if not client:
         return None
     try:
-        value = await client.get(key)
+        return await client.get(key)
     except RedisError:
-        # Redis unavailable or failing; degrade gracefully to cache miss.
-        return None
-    if value is None:
-        return None
-    try:
-        return json.loads(value)
-    except Exception:  # noqa: BLE001
         return None
 
 
-async def cache_set_json(key: str, value: Any, ttl_seconds: int) -> None:
+async def cache_set_bytes(key: str, value: bytes, ttl_seconds: int) -> None:
     client = get_redis()
     if not client:
         return
     try:
-        data = json.dumps(value)
-    except TypeError:
-        return
-    try:
-        await client.set(key, data, ex=ttl_seconds)
+        await client.set(key, value, ex=ttl_seconds)
     except RedisError:
-        # Ignore cache write failures
         return
 
+
+def remember_posts(post_ids: Iterable[uuid.UUID]) -> None:
+    for post_id in post_ids:
+        _known_posts[post_id] = True
+
+
+def is_known_post(post_id: uuid.UUID) -> bool:
+    return post_id in _known_posts
+
+
+def forget_post(post_id: uuid.UUID) -> None:
+    _known_posts.pop(post_id, None)
@@ -1,14 +1,35 @@
 """Centralized constants for cache keys, TTLs, and app defaults."""
 
 # Cache key patterns
-FEED_CACHE_KEY_TEMPLATE = "posts:limit={limit}:cursor={cursor}"
-LIBRARY_RECIPES_CACHE_KEY = "library:recipes"
-LIBRARY_PLACES_CACHE_KEY = "library:places"
-LIBRARY_HISTORY_CACHE_KEY = "library:history"
+# Bump the version whenever the cached value's format changes, so pods on either
+# side of a rolling update never read each other's entries.
+FEED_CACHE_KEY_TEMPLATE = "posts:v2:limit={limit}:cursor={cursor}"
 
 # Cache TTLs (seconds)
 FEED_CACHE_TTL_SECONDS = 5
-LIBRARY_CACHE_TTL_SECONDS = 60
+
+# Redis connection pool: a pool checkout waits at most REDIS_POOL_TIMEOUT_SECONDS,
+# after which the cache helpers treat the call as a miss.
+REDIS_MAX_CONNECTIONS = 64
+REDIS_POOL_TIMEOUT_SECONDS = 0.5
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = 30
+
+# Write batching: concurrent single-row INSERTs are flushed together after at
+# most INSERT_BATCH_MAX_WAIT_SECONDS, or as soon as INSERT_BATCH_MAX_SIZE are queued.
+INSERT_BATCH_MAX_SIZE = 128
+INSERT_BATCH_MAX_WAIT_SECONDS = 0.005
+
+# Upper bound on posts accepted by one POST /posts/bulk request.
+POSTS_BULK_MAX_SIZE = 500
+
+# In-process cache of post ids known to exist (per API process).
+KNOWN_POSTS_MAXSIZE = 10_000
+KNOWN_POSTS_TTL_SECONDS = 60
+
+# In-process cache of verified JWT payloads, keyed by token hash (per API process).
+# Entries also expire at the token's own exp if that comes sooner.
+JWT_CACHE_MAXSIZE = 10_000
+JWT_CACHE_TTL_SECONDS = 60
 
 # Default author name for anonymous users
 DEFAULT_AUTHOR_NAME = "Guest"
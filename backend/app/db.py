@@ -6,7 +6,18 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.settings import settings
 
-engine = create_async_engine(settings.database_url, pool_pre_ping=True)
+engine = create_async_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    connect_args={
+        # SQLAlchemy's per-connection cache of asyncpg prepared statements, and
+        # asyncpg's own cache; both default to 100, below our hot query set.
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+    },
+)
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -30,3 +30,13 @@ async def get_optional_user(
         return result.scalar_one_or_none()
     except Exception:  # noqa: BLE001
         return None
+
+
+async def get_current_user(user: User | None = Depends(get_optional_user)) -> User:
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
@@ -1,8 +1,12 @@
 """Bartender Journal API — application entry point."""
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -11,16 +15,29 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 from app.admin import setup_admin
+from app.batching import comment_batcher, post_batcher
+from app.cache import close_redis, init_redis
 from app.constants import OTEL_SERVICE_NAME
-from app.metrics import instrumentator
-from app.middleware import add_app_header
+from app.metrics import metrics_endpoint
+from app.middleware import AppMiddleware, NegotiatingGZipMiddleware
 from app.routes import auth, comments, health, library, posts
 from app.settings import settings
 
-app = FastAPI(title=settings.app_name)
 
-# --- Prometheus auto-instrumentation ---
-instrumentator.instrument(app).expose(app)
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Open the Redis pool up front so the first request doesn't pay for it.
+    init_redis()
+    yield
+    await post_batcher.aclose()
+    await comment_batcher.aclose()
+    await close_redis()
+
+
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# --- Prometheus scrape endpoint (HTTP metrics are recorded by AppMiddleware) ---
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 # --- OpenTelemetry ---
 resource = Resource.create({"service.name": OTEL_SERVICE_NAME})
@@ -38,6 +55,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Compression ---
+app.add_middleware(NegotiatingGZipMiddleware, minimum_size=500)
+
+# --- Custom middleware (outermost user middleware; unhandled-error 500s bypass it) ---
+app.add_middleware(AppMiddleware)
+
 # --- Admin panel ---
 setup_admin(app)
 
@@ -47,6 +70,3 @@ app.include_router(auth.router)
 app.include_router(posts.router)
 app.include_router(comments.router)
 app.include_router(library.router)
-
-# --- Custom middleware ---
-app.middleware("http")(add_app_header)
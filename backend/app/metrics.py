@@ -1,10 +1,21 @@
-"""Prometheus business metrics and auto-instrumentation setup."""
+"""Prometheus business metrics and the /metrics scrape endpoint."""
 from __future__ import annotations
 
-from prometheus_client import Counter, Histogram
-from prometheus_fastapi_instrumentator import Instrumentator
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Histogram, generate_latest
+from starlette.requests import Request
+from starlette.responses import Response
 
-instrumentator = Instrumentator()
+# Same names and labels the Grafana dashboards already query.
+HTTP_REQUESTS = Counter(
+    "http_requests",
+    "Total HTTP requests by route template, method and status code",
+    labelnames=("handler", "method", "status"),
+)
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds by route template and method",
+    labelnames=("handler", "method"),
+)
 
 POSTS_CREATED = Counter(
     "bartender_posts_created",
@@ -35,3 +46,7 @@ COMMENT_CREATE_SECONDS = Histogram(
     "Comment creation latency in seconds",
     buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.5, 1, 2, 5),
 )
+
+
+async def metrics_endpoint(_: Request) -> Response:
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -1,12 +1,90 @@
 """Custom ASGI middleware."""
 from __future__ import annotations
 
-from fastapi import Request
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.constants import APP_HEADER_NAME, APP_HEADER_VALUE
+from app.metrics import HTTP_REQUEST_DURATION_SECONDS, HTTP_REQUESTS
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values and ``*``."""
+    gzip_q: float | None = None
+    any_q: float | None = None
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "gzip":
+            gzip_q = q
+        elif coding == "*":
+            any_q = q
+    if gzip_q is not None:
+        return gzip_q > 0
+    return any_q is not None and any_q > 0
+
+
+class NegotiatingGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that only compresses when the client's Accept-Encoding allows gzip.
+
+    Starlette's version tests for the substring "gzip", so it also compresses for
+    ``gzip;q=0`` and ``x-gzip``.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and accepts_gzip(Headers(scope=scope).get("accept-encoding", "")):
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class AppMiddleware:
+    """Stamp the app header on responses and record HTTP metrics.
+
+    Pure ASGI: wrapping ``send`` costs one extra call per message, without the
+    task and stream plumbing of BaseHTTPMiddleware. It sees HTTPException and
+    validation error responses, unknown paths and mounted apps. An unhandled
+    exception propagates through it to Starlette's ServerErrorMiddleware, which
+    sends the 500 without ``x-app``; the request is still counted as a 500.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
 
+        async def send_with_header(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append(APP_HEADER_NAME, APP_HEADER_VALUE)
+            await send(message)
 
-async def add_app_header(request: Request, call_next):
-    response = await call_next(request)
-    response.headers[APP_HEADER_NAME] = APP_HEADER_VALUE
-    return response
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            # FastAPI stores the matched APIRoute in the scope; anything else
+            # (unknown paths, /metrics, /admin) is grouped under "none".
+            route = scope.get("route")
+            handler = route.path if route is not None else "none"
+            method = scope["method"]
+            HTTP_REQUESTS.labels(handler=handler, method=method, status=str(status)).inc()
+            HTTP_REQUEST_DURATION_SECONDS.labels(handler=handler, method=method).observe(time.perf_counter() - started)
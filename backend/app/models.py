@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import os
+import time
 import uuid
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy import CHAR, CheckConstraint, DateTime, ForeignKey, Index, String, Text, TypeDecorator, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -13,20 +15,45 @@ class Base(DeclarativeBase):
     pass
 
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (RFC 9562): consecutive inserts land together at the right edge of the PK index."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class PostType(StrEnum):
     text = "text"
     link = "link"
     photo = "photo"
 
 
+class PostTypeCode(TypeDecorator):
+    """Stores PostType as a one-letter code in a CHAR(1) column; the app only ever sees PostType."""
+
+    impl = CHAR(1)
+    cache_ok = True
+
+    _ENCODE = {PostType.text: "t", PostType.link: "l", PostType.photo: "p"}
+    _DECODE = {code: post_type for post_type, code in _ENCODE.items()}
+
+    def process_bind_param(self, value, dialect):
+        # Plain strings (e.g. from admin forms) are accepted as PostType values.
+        return None if value is None else self._ENCODE[PostType(value)]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self._DECODE[value]
+
+
 class User(Base):
     __tablename__ = "users"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email: Mapped[str] = mapped_column(String(320), nullable=False, unique=True, index=True)
     username: Mapped[str] = mapped_column(String(50), nullable=False, unique=True, index=True)
-    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    password_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.statement_timestamp())
 
     posts: Mapped[list["Post"]] = relationship(back_populates="author", cascade="all, delete-orphan")
     comments: Mapped[list["Comment"]] = relationship(back_populates="author", cascade="all, delete-orphan")
@@ -34,31 +61,48 @@ class User(Base):
 
 class Post(Base):
     __tablename__ = "posts"
+    # Matches the feed's keyset order so pagination is a single index range scan.
+    __table_args__ = (
+        Index("ix_posts_created_at_id_desc", text("created_at DESC"), text("id DESC")),
+        CheckConstraint("type IN ('t', 'l', 'p')", name="ck_posts_type"),
+        CheckConstraint("char_length(link_url) <= 2048", name="ck_posts_link_url_len"),
+        CheckConstraint("char_length(image_url) <= 2048", name="ck_posts_image_url_len"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    # clock_timestamp() rather than now(): rows written in one batched statement or
+    # transaction still get distinct, insertion-ordered timestamps.
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.clock_timestamp())
 
-    type: Mapped[PostType] = mapped_column(Enum(PostType, name="post_type"), nullable=False)
+    type: Mapped[PostType] = mapped_column(PostTypeCode, nullable=False)
 
     title: Mapped[str | None] = mapped_column(String(140), nullable=True)
     body: Mapped[str | None] = mapped_column(Text, nullable=True)
-    link_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
-    image_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
+    link_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    image_url: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     author_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     author_name: Mapped[str | None] = mapped_column(String(80), nullable=True)
 
-    author: Mapped[User | None] = relationship(back_populates="posts")
-    comments: Mapped[list["Comment"]] = relationship(back_populates="post", cascade="all, delete-orphan")
+    # raise_on_sql turns accidental lazy loads (N+1) into errors; load explicitly at the query site.
+    # passive_deletes leaves comment removal to the FK's ON DELETE CASCADE instead of loading them.
+    author: Mapped[User | None] = relationship(back_populates="posts", lazy="raise_on_sql")
+    comments: Mapped[list["Comment"]] = relationship(
+        back_populates="post", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
 
 
 class Comment(Base):
     __tablename__ = "comments"
-    __table_args__ = (UniqueConstraint("id", "post_id", name="uq_comment_id_post_id"),)
+    __table_args__ = (
+        UniqueConstraint("id", "post_id", name="uq_comment_id_post_id"),
+        # Serves a post's comment list in order and the feed's per-post counts.
+        Index("ix_comments_post_id_created", "post_id", "created_at", "id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    post_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    post_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.clock_timestamp(), index=True)
 
     body: Mapped[str] = mapped_column(Text, nullable=False)
 
@@ -66,5 +110,5 @@ class Comment(Base):
     author_name: Mapped[str | None] = mapped_column(String(80), nullable=True)
 
     post: Mapped[Post] = relationship(back_populates="comments")
-    author: Mapped[User | None] = relationship(back_populates="comments")
+    author: Mapped[User | None] = relationship(back_populates="comments", lazy="raise_on_sql")
 
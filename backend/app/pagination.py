@@ -2,24 +2,34 @@
 from __future__ import annotations
 
 import base64
-import json
+import struct
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException
 
+# Cursor layout: created_at as big-endian microseconds since the epoch, then the raw post UUID.
+# 24 bytes is a multiple of 3, so the base64 form is always 32 characters with no padding.
+_CURSOR = struct.Struct(">Q16s")
+_CURSOR_LEN = 32
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Reused across calls; encode_cursor never awaits, so one buffer is safe on the event loop.
+_CURSOR_BUF = bytearray(_CURSOR.size)
+
 
 def encode_cursor(created_at: datetime, post_id: uuid.UUID) -> str:
-    payload = {"created_at": created_at.isoformat(), "id": str(post_id)}
-    raw = json.dumps(payload).encode("utf-8")
-    return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
+    micros = (created_at - _EPOCH) // _MICROSECOND
+    _CURSOR.pack_into(_CURSOR_BUF, 0, micros, post_id.bytes)
+    return base64.urlsafe_b64encode(_CURSOR_BUF).decode("ascii")
 
 
 def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
     try:
-        padding = "=" * (-len(cursor) % 4)
-        raw = base64.urlsafe_b64decode((cursor + padding).encode("utf-8"))
-        data = json.loads(raw.decode("utf-8"))
-        return datetime.fromisoformat(data["created_at"]), uuid.UUID(data["id"])
+        if len(cursor) != _CURSOR_LEN:
+            raise ValueError("bad cursor length")
+        micros, id_bytes = _CURSOR.unpack(base64.urlsafe_b64decode(cursor))
+        return _EPOCH + timedelta(microseconds=micros), uuid.UUID(bytes=id_bytes)
     except Exception as e:  # noqa: BLE001
         raise HTTPException(status_code=400, detail="Invalid cursor") from e
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,14 +9,15 @@ from app.db import get_db
 from app.metrics import AUTH_LOGINS
 from app.models import User
 from app.schemas import AuthLoginRequest, AuthRegisterRequest, AuthTokenResponse
-from app.security import create_access_token, hash_password, verify_password
+from app.security import create_access_token, hash_password_async, verify_password_async
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=AuthTokenResponse, status_code=201)
-async def register(payload: AuthRegisterRequest, db: AsyncSession = Depends(get_db)) -> AuthTokenResponse:
-    user = User(email=payload.email, username=payload.username, password_hash=hash_password(payload.password))
+async def register(payload: AuthRegisterRequest, db: AsyncSession = Depends(get_db)) -> Response:
+    password_hash = await hash_password_async(payload.password)
+    user = User(email=payload.email, username=payload.username, password_hash=password_hash)
     db.add(user)
     try:
         await db.commit()
@@ -24,16 +25,21 @@ async def register(payload: AuthRegisterRequest, db: AsyncSession = Depends(get_
         await db.rollback()
         raise HTTPException(status_code=409, detail="Username or email already exists")
     token = create_access_token(str(user.id))
-    return AuthTokenResponse(access_token=token)
+    return Response(AuthTokenResponse(access_token=token).model_dump_json(), status_code=201, media_type="application/json")
 
 
 @router.post("/login", response_model=AuthTokenResponse)
-async def login(payload: AuthLoginRequest, db: AsyncSession = Depends(get_db)) -> AuthTokenResponse:
+async def login(payload: AuthLoginRequest, db: AsyncSession = Depends(get_db)) -> Response:
     result = await db.execute(select(User).where(User.username == payload.username))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(payload.password, user.password_hash):
+    verified, new_hash = await verify_password_async(payload.password, user.password_hash) if user else (False, None)
+    if not verified:
         AUTH_LOGINS.labels(outcome="failure").inc()
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # Stored hash predates the current Argon2 parameters; upgrade it transparently.
+        user.password_hash = new_hash
+        await db.commit()
     AUTH_LOGINS.labels(outcome="success").inc()
     token = create_access_token(str(user.id))
-    return AuthTokenResponse(access_token=token)
+    return Response(AuthTokenResponse(access_token=token).model_dump_json(), media_type="application/json")
@@ -1,132 +1,254 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
 import time
-import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import desc, func, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import desc, func, insert, lambda_stmt, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.cache import cache_get_json, cache_set_json
+from app.batching import post_batcher
+from app.cache import cache_get_bytes, cache_set_bytes, remember_posts
 from app.constants import FEED_CACHE_KEY_TEMPLATE, FEED_CACHE_TTL_SECONDS
 from app.db import get_db
-from app.dependencies import get_optional_user
+from app.dependencies import get_current_user, get_optional_user
 from app.helpers import resolve_author_name
 from app.metrics import FEED_CACHE_REQUESTS, POST_CREATE_SECONDS, POSTS_CREATED
+from app.middleware import accepts_gzip
 from app.models import Comment, Post, PostType, User
 from app.pagination import decode_cursor, encode_cursor
-from app.schemas import CursorPage, PostCreateRequest, PostResponse
+from app.schemas import CursorPage, PostBulkCreateRequest, PostBulkCreateResponse, PostCreateRequest, PostResponse
+from app.serialization import dumps
 
 router = APIRouter(tags=["posts"])
 
 
+# Feed loads currently running, by cache key. Concurrent misses for the same
+# page await the leader's result instead of each querying the database.
+_inflight: dict[str, asyncio.Future[bytes]] = {}
+
+
+class _FeedLoadAbandoned(Exception):
+    """Set on an in-flight feed load whose leader was cancelled before finishing."""
+
+
+# Core INSERT for the bulk endpoint: one statement for all rows, ids back in input order.
+_BULK_INSERT = (
+    insert(Post)
+    .returning(Post.id, sort_by_parameter_order=True)
+    .execution_options(render_nulls=True)
+)
+
+# Cached feed entries start with a fixed-length weak ETag: W/"<32 hex chars>".
+_FEED_ETAG_PREFIX = b'W/"'
+_FEED_ETAG_LEN = 36
+
+
+# Feed items are selected as labeled columns so rows encode as-is: the author
+# name is resolved in SQL and the comment count comes from a correlated
+# subquery, so the LIMIT still applies before any counting happens.
+_FEED_COLUMNS = (
+    Post.id,
+    Post.created_at,
+    Post.type,
+    Post.title,
+    Post.body,
+    Post.link_url,
+    Post.image_url,
+    func.coalesce(User.username, Post.author_name).label("author_name"),
+    select(func.count(Comment.id))
+    .where(Comment.post_id == Post.id)
+    .correlate(Post)
+    .scalar_subquery()
+    .label("comment_count"),
+)
+
+
+async def _load_feed_page(db: AsyncSession, limit: int, cursor: str | None) -> bytes:
+    # One round trip. Built as a lambda statement so the compiled SQL is cached
+    # by structure; limit and cursor values are closure variables and become
+    # bound parameters instead of cache-key parts.
+    fetch = limit + 1
+    q = lambda_stmt(
+        lambda: select(*_FEED_COLUMNS)
+        .outerjoin(User, User.id == Post.author_id)
+        .order_by(desc(Post.created_at), desc(Post.id))
+    )
+    if cursor:
+        (created_at, post_id) = decode_cursor(cursor)
+        # Row-value comparison, so Postgres uses it as a bound on the feed index scan.
+        q += lambda s: s.where(tuple_(Post.created_at, Post.id) < tuple_(created_at, post_id))
+    q += lambda s: s.limit(fetch)
+
+    result = await db.execute(q)
+    rows = result.all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    remember_posts(row.id for row in rows)
+
+    last = rows[-1] if rows else None
+    next_cursor = encode_cursor(last.created_at, last.id) if has_more and last else None
+    return dumps({"items": rows, "next_cursor": next_cursor})
+
+
+def _pack_feed_entry(body: bytes) -> bytes:
+    """Build the cached form of a feed page: its ETag followed by the gzipped JSON."""
+    etag = _FEED_ETAG_PREFIX + hashlib.blake2b(body, digest_size=16).hexdigest().encode("ascii") + b'"'
+    return etag + gzip.compress(body)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison: a ``W/`` prefix on either side is ignored."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == opaque for t in if_none_match.split(","))
+
+
+def _feed_response(request: Request, entry: bytes) -> Response:
+    etag = entry[:_FEED_ETAG_LEN].decode("ascii")
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    gz = entry[_FEED_ETAG_LEN:]
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        # Already compressed; GZipMiddleware passes responses with Content-Encoding through untouched.
+        headers["Content-Encoding"] = "gzip"
+        return Response(gz, media_type="application/json", headers=headers)
+    return Response(gzip.decompress(gz), media_type="application/json", headers=headers)
+
+
 @router.get("/posts", response_model=CursorPage)
 async def list_posts(
+    request: Request,
     limit: int = 10,
     cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
-) -> CursorPage:
+) -> Response:
     limit = max(1, min(limit, 50))
 
     cache_key = FEED_CACHE_KEY_TEMPLATE.format(limit=limit, cursor=cursor or "")
-    cached = await cache_get_json(cache_key)
-    if cached is not None:
+    cached = await cache_get_bytes(cache_key)
+    # Anything that isn't a packed entry (e.g. written by an older release) is a miss.
+    if cached is not None and cached.startswith(_FEED_ETAG_PREFIX):
         FEED_CACHE_REQUESTS.labels(outcome="hit").inc()
-        return CursorPage(**cached)
+        return _feed_response(request, cached)
 
     FEED_CACHE_REQUESTS.labels(outcome="miss").inc()
 
-    q = (
-        select(Post)
-        .options(selectinload(Post.author))
-        .order_by(desc(Post.created_at), desc(Post.id))
-        .limit(limit + 1)
-    )
-    if cursor:
-        (created_at, post_id) = decode_cursor(cursor)
-        q = q.where(
-            (Post.created_at < created_at)
-            | ((Post.created_at == created_at) & (Post.id < post_id))
-        )
-
-    result = await db.execute(q)
-    posts = list(result.scalars().all())
-
-    has_more = len(posts) > limit
-    posts = posts[:limit]
-
-    counts: dict[uuid.UUID, int] = {}
-    if posts:
-        post_ids = [p.id for p in posts]
-        c_result = await db.execute(
-            select(Comment.post_id, func.count(Comment.id))
-            .where(Comment.post_id.in_(post_ids))
-            .group_by(Comment.post_id)
-        )
-        counts = {row[0]: int(row[1]) for row in c_result.all()}
-
-    items = [
-        PostResponse(
-            id=p.id,
-            created_at=p.created_at,
-            type=PostType(p.type),
-            title=p.title,
-            body=p.body,
-            link_url=p.link_url,
-            image_url=p.image_url,
-            author_name=p.author.username if p.author_id and p.author else p.author_name,
-            comment_count=counts.get(p.id, 0),
-        )
-        for p in posts
-    ]
-
-    next_cursor = encode_cursor(posts[-1].created_at, posts[-1].id) if has_more and posts else None
-    page = CursorPage(items=items, next_cursor=next_cursor)
-    await cache_set_json(cache_key, page.model_dump(mode="json"), ttl_seconds=FEED_CACHE_TTL_SECONDS)
-    return page
+    while (inflight := _inflight.get(cache_key)) is not None:
+        try:
+            return _feed_response(request, await asyncio.shield(inflight))
+        except _FeedLoadAbandoned:
+            # The leader's request was cancelled; the first follower to wake takes over the load.
+            continue
+
+    fut: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = fut
+    try:
+        try:
+            entry = _pack_feed_entry(await _load_feed_page(db, limit, cursor))
+        except Exception as e:
+            fut.set_exception(e)
+            # Mark it retrieved so a failure nobody else awaited isn't logged as unhandled.
+            fut.exception()
+            raise
+        fut.set_result(entry)
+        await cache_set_bytes(cache_key, entry, ttl_seconds=FEED_CACHE_TTL_SECONDS)
+    finally:
+        _inflight.pop(cache_key, None)
+        if not fut.done():
+            fut.set_exception(_FeedLoadAbandoned())
+            fut.exception()
+    return _feed_response(request, entry)
+
+
+def _missing_type_field(payload: PostCreateRequest) -> str | None:
+    if payload.type == PostType.text and not payload.body:
+        return "body is required for text posts"
+    if payload.type == PostType.link and not payload.link_url:
+        return "link_url is required for link posts"
+    if payload.type == PostType.photo and not payload.image_url:
+        return "image_url is required for photo posts"
+    return None
 
 
 @router.post("/posts", response_model=PostResponse, status_code=201)
 async def create_post(
     payload: PostCreateRequest,
     user: User | None = Depends(get_optional_user),
-    db: AsyncSession = Depends(get_db),
-) -> PostResponse:
-    if payload.type == PostType.text and not payload.body:
-        raise HTTPException(status_code=400, detail="body is required for text posts")
-    if payload.type == PostType.link and not payload.link_url:
-        raise HTTPException(status_code=400, detail="link_url is required for link posts")
-    if payload.type == PostType.photo and not payload.image_url:
-        raise HTTPException(status_code=400, detail="image_url is required for photo posts")
+) -> Response:
+    error = _missing_type_field(payload)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
 
     author_name = resolve_author_name(user, payload.author_name)
 
-    post = Post(
+    started = time.perf_counter()
+    row = await post_batcher.submit({
+        "type": payload.type,
+        "title": payload.title,
+        "body": payload.body,
+        "link_url": payload.link_url,
+        "image_url": payload.image_url,
+        "author_id": user.id if user else None,
+        "author_name": None if user else author_name,
+    })
+    remember_posts([row.id])
+    POSTS_CREATED.labels(type=payload.type.value).inc()
+    POST_CREATE_SECONDS.observe(time.perf_counter() - started)
+
+    post = PostResponse(
+        id=row.id,
+        created_at=row.created_at,
         type=payload.type,
         title=payload.title,
         body=payload.body,
-        link_url=str(payload.link_url) if payload.link_url else None,
-        image_url=str(payload.image_url) if payload.image_url else None,
-        author_id=user.id if user else None,
-        author_name=None if user else author_name,
+        link_url=payload.link_url,
+        image_url=payload.image_url,
+        author_name=author_name,
+        comment_count=0,
     )
+    return Response(post.model_dump_json(), status_code=201, media_type="application/json")
+
+
+@router.post("/posts/bulk", response_model=PostBulkCreateResponse, status_code=201)
+async def bulk_create_posts(
+    payload: PostBulkCreateRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Create many posts as the current user with a single multi-row INSERT ... RETURNING."""
+    for i, post in enumerate(payload.posts):
+        error = _missing_type_field(post)
+        if error:
+            raise HTTPException(status_code=400, detail=f"posts[{i}]: {error}")
+
     started = time.perf_counter()
-    db.add(post)
+    result = await db.execute(
+        _BULK_INSERT,
+        [
+            {
+                "type": post.type,
+                "title": post.title,
+                "body": post.body,
+                "link_url": post.link_url,
+                "image_url": post.image_url,
+                "author_id": user.id,
+                "author_name": None,
+            }
+            for post in payload.posts
+        ],
+    )
+    ids = result.scalars().all()
     await db.commit()
-    await db.refresh(post)
-    post_type_value = post.type.value if isinstance(post.type, PostType) else str(post.type)
-    POSTS_CREATED.labels(type=post_type_value).inc()
+    remember_posts(ids)
+    for post in payload.posts:
+        POSTS_CREATED.labels(type=post.type.value).inc()
     POST_CREATE_SECONDS.observe(time.perf_counter() - started)
 
-    return PostResponse(
-        id=post.id,
-        created_at=post.created_at,
-        type=PostType(post.type),
-        title=post.title,
-        body=post.body,
-        link_url=post.link_url,
-        image_url=post.image_url,
-        author_name=author_name,
-        comment_count=0,
-    )
+    return Response(PostBulkCreateResponse(ids=ids).model_dump_json(), status_code=201, media_type="application/json")
@@ -1,14 +1,36 @@
 from __future__ import annotations
 
+import re
 import uuid
 from datetime import datetime
+from typing import Annotated
+from urllib.parse import urlsplit
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field
 
+from app.constants import POSTS_BULK_MAX_SIZE
 from app.models import PostType
 
+_WHITESPACE = re.compile(r"\s")
+
+
+def _validate_http_url(value: str) -> str:
+    # A cheap absolute-http(s) check instead of HttpUrl's full parse; the value is stored as sent.
+    parts = urlsplit(value)
+    if parts.scheme not in ("http", "https") or not parts.hostname or _WHITESPACE.search(value):
+        raise ValueError("must be an absolute http(s) URL")
+    return value
+
+
+HttpUrlStr = Annotated[str, Field(max_length=2048), AfterValidator(_validate_http_url)]
+
+# Response schemas can be validated straight from ORM objects or rows.
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True, extra="ignore")
+
 
 class UserPublic(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: uuid.UUID
     username: str
     created_at: datetime
@@ -34,12 +56,24 @@ class PostCreateRequest(BaseModel):
     type: PostType
     title: str | None = Field(default=None, max_length=140)
     body: str | None = None
-    link_url: HttpUrl | None = None
-    image_url: HttpUrl | None = None
+    link_url: HttpUrlStr | None = None
+    image_url: HttpUrlStr | None = None
     author_name: str | None = Field(default=None, max_length=80)
 
 
+class PostBulkCreateRequest(BaseModel):
+    posts: list[PostCreateRequest] = Field(min_length=1, max_length=POSTS_BULK_MAX_SIZE)
+
+
+class PostBulkCreateResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
+    ids: list[uuid.UUID]
+
+
 class PostResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: uuid.UUID
     created_at: datetime
     type: PostType
@@ -57,6 +91,8 @@ class CommentCreateRequest(BaseModel):
 
 
 class CommentResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: uuid.UUID
     post_id: uuid.UUID
     created_at: datetime
@@ -65,6 +101,8 @@ class CommentResponse(BaseModel):
 
 
 class CursorPage(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     items: list[PostResponse]
     next_cursor: str | None = None
 
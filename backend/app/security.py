@@ -1,33 +1,80 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
 from passlib.context import CryptContext
 
+from app.constants import JWT_CACHE_MAXSIZE, JWT_CACHE_TTL_SECONDS
 from app.settings import settings
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Explicit Argon2id cost so login latency and memory are predictable. Hashes made
+# with other parameters still verify and are replaced on the next login.
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    argon2__type="ID",
+    argon2__memory_cost=settings.argon2_memory_kib,
+    argon2__time_cost=settings.argon2_time_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+    deprecated="auto",
+)
+
+# Signing inputs resolved once instead of per token.
+_JWT_KEY = settings.jwt_secret_key.encode("utf-8")
+_JWT_ALG = settings.jwt_algorithm
+_JWT_ALGS = [settings.jwt_algorithm]
+_EXP_SECONDS = settings.jwt_access_token_expires_minutes * 60
+
+# Argon2 is deliberately slow; hashing runs on a dedicated, bounded thread pool
+# (argon2-cffi releases the GIL) so it never blocks the event loop, a login burst
+# can't starve the default executor, and at most a few ~46 MiB buffers are live.
+_hash_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="argon2")
+
+# Verified payloads with their exp, keyed by a truncated SHA-256 of the token, so
+# clients reusing a bearer token skip the signature check. Only valid tokens are
+# stored. Accessed from the event loop only, so no lock is needed.
+_token_cache: TTLCache[bytes, tuple[dict, int]] = TTLCache(maxsize=JWT_CACHE_MAXSIZE, ttl=JWT_CACHE_TTL_SECONDS)
 
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+def verify_password(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """Verify a password; also return a fresh hash if the stored one uses outdated parameters."""
+    return pwd_context.verify_and_update(password, password_hash)
+
+
+async def hash_password_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> tuple[bool, str | None]:
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, verify_password, password, password_hash)
 
 
 def create_access_token(subject: str) -> str:
-    now = datetime.now(tz=timezone.utc)
-    exp = now + timedelta(minutes=settings.jwt_access_token_expires_minutes)
-    payload = {"sub": subject, "iat": int(now.timestamp()), "exp": int(exp.timestamp())}
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    iat = int(time.time())
+    payload = {"sub": subject, "iat": iat, "exp": iat + _EXP_SECONDS}
+    return jwt.encode(payload, _JWT_KEY, algorithm=_JWT_ALG)
 
 
 def decode_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    cached = _token_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
     try:
-        return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-    except JWTError as e:
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGS)
+    except jwt.PyJWTError as e:
         raise ValueError("Invalid token") from e
+    exp = payload.get("exp")
+    if isinstance(exp, int):
+        _token_cache[key] = (payload, exp)
+    return payload
 
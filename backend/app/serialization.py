@@ -0,0 +1,25 @@
+"""orjson encoding for query results."""
+from __future__ import annotations
+
+import uuid
+
+import orjson
+from sqlalchemy import Row
+
+
+def _default(obj: object) -> object:
+    # Column-select rows encode as objects keyed by their labels; asyncpg returns its
+    # own uuid.UUID subclass, which orjson only serializes via default.
+    if isinstance(obj, Row):
+        return obj._asdict()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError
+
+
+def dumps(obj: object) -> bytes:
+    """Encode to JSON bytes, serializing SQLAlchemy rows without building models first.
+
+    UTC datetimes end in ``Z``, matching Pydantic's output on the POST endpoints.
+    """
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
@@ -17,6 +17,21 @@ celery_app = Celery(
     backend=broker_url,
 )
 
+# One task prefetched per worker slot and acked after it finishes, so a busy worker
+# can't hoard the queue and a crashed one hands its tasks back to the broker.
+celery_app.conf.update(
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Recycles child processes, so it only takes effect with CELERY_WORKER_POOL=prefork.
+    worker_max_tasks_per_child=1000,
+    worker_pool=settings.celery_worker_pool,
+    worker_concurrency=settings.celery_worker_concurrency,
+    broker_connection_retry_on_startup=True,
+    task_compression="gzip",
+    result_expires=3600,
+)
+
 
 @celery_app.task(name="tasks.process_image")
 def process_image(post_id: str, image_url: str | None) -> dict[str, Any]:
@@ -1,80 +1,120 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 import random
 import time
-import urllib.error
-import urllib.request
-from datetime import datetime
+
+import httpx
+import orjson
 
 API_BASE = os.getenv("API_BASE", "http://backend:8000").rstrip("/")
 INTERVAL_SECONDS = float(os.getenv("INTERVAL_SECONDS", "0.75"))
 AUTHOR_NAME = os.getenv("AUTHOR_NAME", "load-bot")
+# Workers running the request mix at once over one pooled client.
+CONCURRENCY = int(os.getenv("CONCURRENCY", "16"))
+# Optional cap on loop iterations per second across all workers (each is 2-4
+# requests); when unset every worker waits INTERVAL_SECONDS between iterations.
+RPS = float(os.getenv("RPS", "0"))
+# Stress/seed mode: when BULK_SIZE > 0, the create step sends BULK_SIZE posts in one
+# POST /posts/bulk request, authenticated with API_TOKEN (a JWT from /auth/login).
+BULK_SIZE = int(os.getenv("BULK_SIZE", "0"))
+API_TOKEN = os.getenv("API_TOKEN", "")
+
+# Request-mix building blocks, built once rather than per iteration.
+_POST_TYPES = ("text", "link", "photo")
+_POST_EXTRAS = {
+    "text": ("body", "Shift review: workflow simulated by traffic generator."),
+    "link": ("link_url", "https://example.com/devops-portfolio"),
+    "photo": ("image_url", "https://picsum.photos/300"),
+}
+_FEED_PATHS = ("/posts?limit=5", "/posts?limit=10", "/posts?limit=20")
+_COMMENT_PAYLOAD = {"body": "Automated engagement for observability tests.", "author_name": AUTHOR_NAME}
 
 
-def _request(method: str, path: str, payload: dict | None = None) -> tuple[int, dict | list | str | None]:
-    url = f"{API_BASE}{path}"
+async def _request(
+    client: httpx.AsyncClient, method: str, path: str, payload: dict | None = None
+) -> tuple[int, dict | list | str | None]:
     body = None
-    headers = {"accept": "application/json"}
+    headers = {}
     if payload is not None:
-        body = json.dumps(payload).encode("utf-8")
+        body = orjson.dumps(payload)
         headers["content-type"] = "application/json"
 
-    req = urllib.request.Request(url=url, data=body, headers=headers, method=method)
     try:
-        with urllib.request.urlopen(req, timeout=8) as resp:
-            raw = resp.read().decode("utf-8")
-            return resp.status, json.loads(raw) if raw else None
-    except urllib.error.HTTPError as exc:
-        raw = exc.read().decode("utf-8")
-        return exc.code, raw
+        resp = await client.request(method, path, content=body, headers=headers)
+        if resp.status_code >= 400:
+            return resp.status_code, resp.text
+        return resp.status_code, orjson.loads(resp.content) if resp.content else None
     except Exception as exc:  # noqa: BLE001
         return 0, str(exc)
 
 
-def _create_post() -> str | None:
+async def _create_post(client: httpx.AsyncClient) -> str | None:
+    post_type = random.choice(_POST_TYPES)
+    field, value = _POST_EXTRAS[post_type]
     payload = {
-        "type": random.choice(["text", "link", "photo"]),
-        "title": f"Synthetic event {datetime.utcnow().isoformat()}",
+        "type": post_type,
+        "title": f"Synthetic event {time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime())}",
         "author_name": AUTHOR_NAME,
+        field: value,
     }
-    if payload["type"] == "text":
-        payload["body"] = "Shift review: workflow simulated by traffic generator."
-    elif payload["type"] == "link":
-        payload["link_url"] = "https://example.com/devops-portfolio"
-    else:
-        payload["image_url"] = "https://picsum.photos/300"
-
-    status, data = _request("POST", "/posts", payload)
+
+    status, data = await _request(client, "POST", "/posts", payload)
     if status in (200, 201) and isinstance(data, dict):
         return data.get("id")
     return None
 
 
-def _comment_on_latest() -> None:
-    status, data = _request("GET", "/posts?limit=1")
+async def _bulk_create_posts(client: httpx.AsyncClient, n: int) -> list[str]:
+    posts = []
+    for _ in range(n):
+        post_type = random.choice(_POST_TYPES)
+        field, value = _POST_EXTRAS[post_type]
+        posts.append({"type": post_type, "title": "Synthetic bulk event", field: value})
+
+    status, data = await _request(client, "POST", "/posts/bulk", {"posts": posts})
+    if status == 201 and isinstance(data, dict):
+        return data.get("ids", [])
+    return []
+
+
+async def _comment_on_latest(client: httpx.AsyncClient) -> None:
+    status, data = await _request(client, "GET", "/posts?limit=1")
     if status != 200 or not isinstance(data, dict) or not data.get("items"):
         return
     post_id = data["items"][0]["id"]
-    _request(
-        "POST",
-        f"/posts/{post_id}/comments",
-        {"body": "Automated engagement for observability tests.", "author_name": AUTHOR_NAME},
-    )
+    await _request(client, "POST", f"/posts/{post_id}/comments", _COMMENT_PAYLOAD)
 
 
-def run() -> None:
+async def _worker(client: httpx.AsyncClient, pause: float) -> None:
+    # Stagger start-up so workers don't fire in lockstep.
+    await asyncio.sleep(random.uniform(0, pause))
     while True:
-        _request("GET", "/healthz")
-        _request("GET", f"/posts?limit={random.choice([5, 10, 20])}")
+        await _request(client, "GET", "/healthz")
+        await _request(client, "GET", random.choice(_FEED_PATHS))
         if random.random() < 0.35:
-            _create_post()
+            if BULK_SIZE > 0:
+                await _bulk_create_posts(client, BULK_SIZE)
+            else:
+                await _create_post(client)
         if random.random() < 0.25:
-            _comment_on_latest()
-        time.sleep(INTERVAL_SECONDS)
+            await _comment_on_latest(client)
+        await asyncio.sleep(pause)
+
+
+async def run(concurrency: int = CONCURRENCY) -> None:
+    if BULK_SIZE > 0 and not API_TOKEN:
+        raise SystemExit("BULK_SIZE requires API_TOKEN (POST /posts/bulk needs an authenticated user)")
+    pause = concurrency / RPS if RPS > 0 else INTERVAL_SECONDS
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    headers = {"accept": "application/json"}
+    if API_TOKEN:
+        headers["authorization"] = f"Bearer {API_TOKEN}"
+    async with httpx.AsyncClient(base_url=API_BASE, timeout=8, limits=limits, headers=headers) as client:
+        await asyncio.gather(*(_worker(client, pause) for _ in range(concurrency)))
 
 
 if __name__ == "__main__":
-    run()
+    asyncio.run(run())